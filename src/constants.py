@@ -1 +1,3 @@
 NAME = "cube"
+FSCK_CHUNK_SIZE = 256
+CAT_FILE_CACHE_SIZE = 1024
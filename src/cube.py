@@ -1,5 +1,9 @@
 import os
+import sys
 import shutil
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import Pool
 from types import NoneType
 import click
 
@@ -7,7 +11,7 @@ from src.config import cli, error_handler
 from src import utils
 from src.logger import logger
 from src.objects import Tree, Commit, Index
-from src.constants import NAME
+from src.constants import NAME, FSCK_CHUNK_SIZE, CAT_FILE_CACHE_SIZE
 
 ROOT = f".{NAME}"
 
@@ -290,3 +294,224 @@ class VCS:
         commit = Commit.from_hash(current_commit_hash)
         VCS._log_helper(commit, current_commit_hash)
 
+
+    @staticmethod
+    def _blob_hashes(tree: Tree):
+        """Yields the hashes of every file in a tree"""
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            if node._is_file():
+                yield node.hash
+            stack.extend(node.subtrees)
+
+    @staticmethod
+    def _collect_reachable() -> tuple:
+        """
+        Walks every commit reachable from the branches, along with the index entries.
+        Returns the set of reachable object hashes, the set of hashes already
+        reported as corrupt and the number of problems found.
+        """
+        reachable, reported, problems = set(), set(), 0
+        pending = []
+        for branch_name, commit_hash in utils.list_branch_pointers().items():
+            if commit_hash:
+                pending.append((commit_hash, f"branch '{branch_name}'"))
+
+        while pending:
+            commit_hash, referrer = pending.pop()
+            if commit_hash in reachable:
+                continue
+            reachable.add(commit_hash)
+
+            if not os.path.isfile(utils.get_object_path(commit_hash)):
+                logger.error(f"missing commit {commit_hash} (referenced by {referrer})")
+                problems += 1
+                continue
+            try:
+                with open(utils.get_object_path(commit_hash), "rb") as f:
+                    commit = Commit.from_file(f)
+                parent = commit.parent
+                blob_hashes = list(VCS._blob_hashes(commit.tree))
+            except Exception as e:
+                logger.error(f"corrupt commit {commit_hash}: cannot be decoded ({e})")
+                reported.add(commit_hash)
+                problems += 1
+                continue
+
+            if parent:
+                pending.append((parent, f"commit {commit_hash}"))
+            for blob_hash in blob_hashes:
+                if blob_hash in reachable:
+                    continue
+                reachable.add(blob_hash)
+                if not os.path.isfile(utils.get_object_path(blob_hash)):
+                    logger.error(f"missing blob {blob_hash} (referenced by commit {commit_hash})")
+                    problems += 1
+
+        # Index() writes a fresh index when none exists, fsck must not modify the repo
+        index_entries = []
+        if os.path.isfile(Index.path):
+            try:
+                index_entries = list(Index(from_file=True).list_entries())
+            except Exception as e:
+                logger.error(f"corrupt index {Index.path}: cannot be decoded ({e})")
+                problems += 1
+        for file_path, file_hash in index_entries:
+            if file_hash in reachable:
+                continue
+            reachable.add(file_hash)
+            if not os.path.isfile(utils.get_object_path(file_hash)):
+                logger.error(f"missing blob {file_hash} (referenced by index entry '{file_path}')")
+                problems += 1
+
+        return reachable, reported, problems
+
+    @staticmethod
+    @cli.command()
+    @click.option(
+        '--jobs', '-j', type=click.IntRange(min=1), default=None, help='Number of worker processes.'
+    )
+    @error_handler
+    @utils.initialization_required
+    def fsck(jobs: int = None):
+        reachable, reported, problems = VCS._collect_reachable()
+
+        checked, dangling = 0, 0
+        jobs = jobs or os.cpu_count() or 1
+        objects = utils.iter_objects()
+        with Pool(jobs) as pool:
+            # imap_unordered queues its whole input up front, so feed it bounded batches
+            while batch := list(islice(objects, FSCK_CHUNK_SIZE * jobs)):
+                for object_hash, problem in pool.imap_unordered(
+                    utils.verify_object, batch, chunksize=FSCK_CHUNK_SIZE // 16
+                ):
+                    checked += 1
+                    if object_hash in reported:
+                        continue
+                    if problem:
+                        logger.error(f"corrupt object {object_hash}: {problem}")
+                        problems += 1
+                    elif object_hash not in reachable:
+                        logger.warning(f"dangling object {object_hash}")
+                        dangling += 1
+
+        msg = f"\nChecked {checked} object(s): {problems} problem(s), {dangling} dangling."
+        if problems:
+            logger.error(msg)
+        else:
+            logger.info(msg)
+
+    @staticmethod
+    @lru_cache(maxsize=CAT_FILE_CACHE_SIZE)
+    def _decode_commit(hash: str) -> Commit | None:
+        """
+        Returns the decoded commit, or None if the object is a blob.
+        Objects are content-addressed, so the answer is cached per hash. A missing
+        object raises OSError, which is not cached.
+        """
+        with open(utils.get_object_path(hash), "rb") as f:
+            if f.read(1) != b"\x80":
+                return None
+            f.seek(0)
+            try:
+                return Commit.from_file(f)
+            except OSError:
+                raise
+            except Exception:
+                return None
+
+    @staticmethod
+    def _resolve_spec(spec: str) -> str | None:
+        """Resolves an object hash, a ref or a '<ref>:<path>' spec to an object hash"""
+        ref, sep, path = spec.partition(":")
+        hash = utils.resolve_ref(ref)
+        if not hash or not utils.is_object_hash(hash):
+            return None
+        if not sep:
+            return hash
+
+        commit = VCS._decode_commit(hash)
+        if not commit:
+            return None
+        node = commit.tree.find(path)
+        if node is None or not node._is_file():
+            return None
+        return node.hash
+
+    @staticmethod
+    def _format_commit(commit: Commit) -> bytes:
+        """Renders a commit as 'parent <hash>', one '<hash> <path>' line per file, a blank line and the message"""
+        lines = [f"parent {commit.parent or 'none'}"]
+        lines += [f"{hash} {path}" for path, hash in commit.tree.files()]
+        lines += ["", commit.message or ""]
+        return "\n".join(lines).encode()
+
+    @staticmethod
+    def _open_object(spec: str) -> tuple:
+        """
+        Resolves a spec and prepares its object without writing anything.
+        Returns (hash, commit contents, None) for commits and (hash, None, open file) for blobs.
+        """
+        hash = VCS._resolve_spec(spec)
+        if not hash:
+            raise FileNotFoundError(spec)
+        object_path = utils.get_object_path(hash)
+        commit = VCS._decode_commit(hash)
+        if commit:
+            if not os.path.isfile(object_path):
+                raise FileNotFoundError(object_path)
+            return hash, VCS._format_commit(commit), None
+        return hash, None, open(object_path, "rb")
+
+    @staticmethod
+    def _write_object(out, hash: str, contents: bytes | None, blob, with_contents: bool):
+        """Writes the header (and contents) of an object prepared by _open_object"""
+        if contents is not None:
+            out.write(f"{hash} commit {len(contents)}\n".encode())
+            if with_contents:
+                out.write(contents + b"\n")
+            return
+
+        # Once the header is out the record cannot be withdrawn, so read errors propagate
+        with blob:
+            size = os.fstat(blob.fileno()).st_size
+            out.write(f"{hash} blob {size}\n".encode())
+            if with_contents:
+                shutil.copyfileobj(blob, out)
+                out.write(b"\n")
+
+    @staticmethod
+    @cli.command(name="cat-file")
+    @click.option(
+        '--batch', 'mode', flag_value='batch', help='Print type, size and contents of each object.'
+    )
+    @click.option(
+        '--batch-check', 'mode', flag_value='batch-check', help='Print type and size of each object.'
+    )
+    @error_handler
+    @utils.initialization_required
+    def cat_file(mode: str):
+        """
+        Reads object hashes or <ref>:<path> specs from stdin, one per line.
+
+        Commit contents are 'parent <hash|none>', then one '<hash> <path>' line per
+        file, a blank line and the commit message. Blob contents are the raw bytes.
+        """
+        if not mode:
+            logger.error("Either --batch or --batch-check is required.")
+            return
+
+        out = sys.stdout.buffer
+        for line in sys.stdin:
+            spec = line.strip()
+            if not spec:
+                continue
+            try:
+                hash, contents, blob = VCS._open_object(spec)
+            except Exception:
+                out.write(f"{spec} missing\n".encode())
+                out.flush()
+                continue
+            VCS._write_object(out, hash, contents, blob, mode == "batch")
+            out.flush()
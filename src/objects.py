@@ -85,6 +85,26 @@ class Tree:
     def _is_file(self) -> bool:
         return len(self.subtrees) == 0 and self.hash is not None
 
+    def find(self, path: str) -> 'Tree | None':
+        """Returns the subtree at the given path, relative to this tree"""
+        node = self
+        for part in os.path.normpath(path).split(os.sep):
+            if part in ("", "."):
+                continue
+            node = next((s for s in node.subtrees if s.name == part), None)
+            if node is None:
+                return None
+        return node
+
+    def files(self, prefix: str = ""):
+        """Yields (path, hash) for every file below this tree"""
+        for subtree in self.subtrees:
+            path = f"{prefix}{subtree.name}"
+            if subtree._is_file():
+                yield path, subtree.hash
+            else:
+                yield from subtree.files(f"{path}/")
+
     def add_subtrees(self, path, hash) -> None:
         normalized_path = os.path.normpath(path)
         if os.path.basename(path) == normalized_path:
@@ -124,6 +144,17 @@ class Tree:
                 self.subtrees.append(subtree_2)        
         
 
+class CommitUnpickler(pickle.Unpickler):
+    """Unpickler that refuses every global except the classes a commit is built from."""
+
+    allowed = {("src.objects", "Commit"), ("src.objects", "Tree")}
+
+    def find_class(self, module, name):
+        if (module, name) in self.allowed:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Global '{module}.{name}' is not allowed in a commit.")
+
+
 class Commit:
     """Commit object."""
     def __init__(self, tree: Tree, parent: str = None, message: str = None):
@@ -142,6 +173,14 @@ class Commit:
     def from_bytes(data: bytes):
         return pickle.loads(data)
     
+    @staticmethod
+    def from_file(file) -> 'Commit':
+        """Decodes a commit from an open file, without loading arbitrary classes"""
+        commit = CommitUnpickler(file).load()
+        if not isinstance(commit, Commit):
+            raise pickle.UnpicklingError("Object is not a commit.")
+        return commit
+
     @staticmethod
     def from_hash(hash: str):
         object_path = utils.get_object_path(hash)
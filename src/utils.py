@@ -54,6 +54,51 @@ def hash_file(filepath: str) -> str:
     return sha.hexdigest()
 
 
+def is_object_hash(name: str) -> bool:
+    """Checks if a name is a full, lowercase SHA-1 hex digest"""
+    return len(name) == 40 and all(c in "0123456789abcdef" for c in name)
+
+
+def iter_objects():
+    """Yields (hash, path) for every file in the objects directory, one at a time"""
+    with os.scandir(f".{NAME}/objects") as dirs:
+        for dir in dirs:
+            if not dir.is_dir():
+                continue
+            with os.scandir(dir.path) as files:
+                for file in files:
+                    if file.is_file():
+                        yield dir.name + file.name, file.path
+
+
+def verify_object(entry: tuple) -> tuple:
+    """
+    Re-hashes an object in chunks and compares it against its name.
+    Objects have no size header, so the size check only catches a file
+    that is truncated or grows while it is being read.
+    Returns (hash, problem), where problem is None if the object is intact.
+    """
+    object_hash, object_path = entry
+    if not is_object_hash(object_hash):
+        return object_hash, "invalid object name"
+
+    sha, size = sha1(), 0
+    try:
+        with open(object_path, 'rb') as f:
+            expected_size = os.fstat(f.fileno()).st_size
+            while chunk := f.read(8192):
+                sha.update(chunk)
+                size += len(chunk)
+    except OSError as e:
+        return object_hash, f"unreadable ({e.strerror})"
+
+    if size != expected_size:
+        return object_hash, f"size mismatch (read {size} of {expected_size} bytes)"
+    if sha.hexdigest() != object_hash:
+        return object_hash, f"hash mismatch (content hashes to {sha.hexdigest()})"
+    return object_hash, None
+
+
 def get_object_path(file_hash: str) -> str:
     """Returns the path where the object should be stored based on its hash"""
     first_2_chars, remaining_chars = file_hash[:2], file_hash[2:]
@@ -165,6 +210,29 @@ def update_branch_pointer(branch_name, commit_hash):
     with open(branch_path, "w") as branch_file:
         branch_file.write(commit_hash)
 
+def list_branch_pointers() -> dict:
+    """Returns a mapping of branch name to the commit hash it points to"""
+    heads_dir = f".{NAME}/refs/heads"
+    pointers = {}
+    if not os.path.isdir(heads_dir):
+        return pointers
+    for root, _, files in os.walk(heads_dir):
+        for file in files:
+            branch_path = os.path.join(root, file)
+            branch_name = os.path.relpath(branch_path, heads_dir).replace(os.sep, "/")
+            with open(branch_path, "r") as branch_file:
+                pointers[branch_name] = branch_file.read().strip()
+    return pointers
+
+def resolve_ref(ref: str) -> str | None:
+    """Resolves 'HEAD', a branch name or a commit hash to a commit hash"""
+    if ref == "HEAD":
+        return get_head_commit_hash()
+    if branch_exists(ref):
+        with open(f".{NAME}/refs/heads/{ref}", "r") as branch_file:
+            return branch_file.read().strip() or None
+    return ref
+
 def branch_exists(branch_name: str):
     """Returns True if the branch already exists, False otherwise"""
     branch_path = f".{NAME}/refs/heads/{branch_name}"